@@ -1,3 +0,0 @@
-@echo off
-cd /d "C:\Users\Saem1001\Documents\GitHub\PicoSync\backend"
-call run_picosync.bat
\ No newline at end of file
@@ -14,19 +14,83 @@ import os
 import sys
 import json
 import hashlib
+import fnmatch
+import io
 import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import platform
 import webbrowser
 from datetime import datetime
 import serial.tools.list_ports
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
+try:
+    import pyudev  # Optional, Linux only: event-driven serial port detection
+except ImportError:
+    pyudev = None
+
 # Configuration file path
 CONFIG_FILE = Path.home() / ".pico_sync_config.json"
 LOG_FILE = Path.home() / ".pico_sync_log.txt"
 
+# Longest mpremote command line built for a batched copy, kept under
+# the 32767 character CreateProcess limit on Windows
+SYNC_COMMAND_MAX_CHARS = 30000
+
+# Seconds between serial port rescans when udev events drive detection
+USB_RESCAN_INTERVAL = 5
+
+# Log entries waiting for display, and lines kept in the log widget
+LOG_QUEUE_SIZE = 5000
+LOG_MAX_LINES = 1000
+
+# Raspberry Pi USB vendor ID and the product ID MicroPython's rp2 port reports
+PICO_VID = 0x2E8A
+MICROPYTHON_PID = 0x0005
+
+def iter_files(root):
+    """Yield every file path under root using scandir's cached dirent types"""
+    pending = [root]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue  # Skip unreadable directories like os.walk does
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path  # Directory symlinks are skipped, not yielded as files
+
+def batch_by_length(filepaths, limit=SYNC_COMMAND_MAX_CHARS):
+    """Split files into chained mpremote copies that each fit on one command line"""
+    batch = []
+    length = 0
+    for filepath in filepaths:
+        # "cp <path> :<name> + " plus room for quoting
+        cost = len(str(filepath)) + len(os.path.basename(filepath)) + 12
+        if batch and length + cost > limit:
+            yield batch
+            batch = []
+            length = 0
+        batch.append(filepath)
+        length += cost
+    if batch:
+        yield batch
+
+def file_digest(path):
+    """Return the SHA-256 hex digest of a file's contents"""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def file_signature(path):
+    """Return a file's [size, mtime_ns] as stored in the sync manifest"""
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
 class PicoFileWatcher(FileSystemEventHandler):
     """Watches for file changes in the configured directory"""
     def __init__(self, callback):
@@ -61,27 +125,46 @@ class PicoSyncManager:
         
         # State variables
         self.config = self.load_config()
+        self.save_after_id = None  # Pending debounced config write
         self.pico_connected = False
         self.auto_sync_enabled = tk.BooleanVar(value=self.config.get('auto_sync', True))
         self.sync_queue = queue.Queue()
-        self.log_queue = queue.Queue()
+        self.log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
         self.current_port = None
+        self.current_pid = None  # USB product ID of the connected Pico, if known
+        self.current_device_id = None  # Serial number (or port) keying the sync manifest
+        self.ports_signature = None
         self.file_observer = None
         self.pico_model = None  # Will detect RP2040 or RP2350
-        self.is_windows = platform.system() == 'Windows'
+        self.mpremote_cmd = None  # Resolved on first use by find_mpremote
+        self.synced_hashes = {}  # Local path -> digest last copied to the Pico
+        self.dirty_files = set()  # Watched files changed since the last sync
+        self.dirty_lock = threading.Lock()
+        self.is_windows = sys.platform == 'win32'
+        
+        # Keep the log file open for the session; line buffering still flushes every entry
+        self.log_lock = threading.Lock()
+        try:
+            self.log_file = open(LOG_FILE, 'a', buffering=1)
+        except OSError:
+            self.log_file = None
+        
+        # Set while a <<LogEvent>> is pending so workers wake Tk once per drain
+        self.log_wake_pending = False
+        self.log_wake_lock = threading.Lock()
         
         # Create UI
         self.create_ui()
         
+        # Drain the log queue whenever log() signals new entries
+        self.root.bind("<<LogEvent>>", lambda event: self.process_logs())
+        
         # Start background threads
         self.start_monitoring()
         
         # Check dependencies on startup
         self.root.after(100, self.check_dependencies)
         
-        # Start log processor
-        self.process_logs()
-        
     def create_ui(self):
         """Create the main UI layout"""
         # Main container
@@ -435,8 +518,30 @@ class PicoSyncManager:
         self.config['show_notifications'] = self.show_notifications_var.get()
         self.config['log_level'] = self.log_level_var.get()
         
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(self.config, f, indent=2)
+        self.schedule_save()
+    
+    def schedule_save(self):
+        """Write the config once changes settle instead of on every call"""
+        if self.save_after_id:
+            self.root.after_cancel(self.save_after_id)
+        self.save_after_id = self.root.after(500, self.write_config)
+    
+    def write_config(self):
+        """Atomically write the config file"""
+        self.save_after_id = None
+        
+        # Write a sibling temp file and swap it in so a crash never leaves half a config
+        fd, temp_path = tempfile.mkstemp(dir=CONFIG_FILE.parent, prefix='.pico_sync_config.')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self.config, f, indent=2)
+            os.replace(temp_path, CONFIG_FILE)
+        except OSError as e:
+            self.log(f"Failed to save config: {e}", "ERROR")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
     
     def check_dependencies(self):
         """Check and install required dependencies"""
@@ -470,14 +575,27 @@ class PicoSyncManager:
         self.progress_bar.start()
         
         def install():
-            for package in packages:
-                self.log(f"Installing {package}...", "INFO")
-                try:
-                    subprocess.check_call([sys.executable, "-m", "pip", 
-                                         "install", package])
-                    self.log(f"Installed {package}", "SUCCESS")
-                except subprocess.CalledProcessError as e:
-                    self.log(f"Failed to install {package}: {e}", "ERROR")
+            # One pip run resolves every package in a single solve
+            self.log(f"Installing {', '.join(packages)}...", "INFO")
+            try:
+                process = subprocess.Popen(
+                    [sys.executable, "-m", "pip", "install",
+                     "--disable-pip-version-check", "--no-warn-script-location", *packages],
+                    stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+                
+                # Stream pip's output so progress shows up in the log
+                for line in process.stdout:
+                    line = line.rstrip()
+                    if line:
+                        self.log(line, "DEBUG")
+                        
+                if process.wait() == 0:
+                    self.mpremote_cmd = None  # Look up the freshly installed mpremote
+                    self.log(f"Installed {', '.join(packages)}", "SUCCESS")
+                else:
+                    self.log(f"Failed to install dependencies (pip exited with {process.returncode})", "ERROR")
+            except OSError as e:
+                self.log(f"Failed to install dependencies: {e}", "ERROR")
             
             self.root.after(0, self.installation_complete)
         
@@ -504,6 +622,9 @@ class PicoSyncManager:
     def monitor_usb(self):
         """Monitor for Pico USB connection"""
         bootsel_detected = False
+        tty_monitor = self.create_tty_monitor()
+        tty_changed = True
+        last_port_scan = 0
         while True:
             try:
                 # Check for BOOTSEL mode (appears as a drive)
@@ -515,34 +636,86 @@ class PicoSyncManager:
                 elif not bootsel_drive and bootsel_detected:
                     bootsel_detected = False
                     
-                # Check for normal Pico connection
-                ports = serial.tools.list_ports.comports()
-                pico_port = None
-                
-                for port in ports:
-                    # Check for Pico identifiers
-                    if (('2e8a' in port.hwid.lower() or 
-                         'raspberry pi pico' in port.description.lower() or
-                         'pico' in port.description.lower())):
-                        pico_port = port.device
-                        break
-                
-                if pico_port and not self.pico_connected:
-                    # Pico connected
-                    self.current_port = pico_port
-                    self.pico_connected = True
-                    self.root.after(0, self.on_pico_connected)
-                elif not pico_port and self.pico_connected:
-                    # Pico disconnected
-                    self.pico_connected = False
-                    self.current_port = None
-                    self.root.after(0, self.on_pico_disconnected)
+                # With udev events the serial ports are only rescanned when a
+                # tty comes or goes, plus an occasional safety-net rescan
+                now = time.monotonic()
+                if (tty_monitor is None or tty_changed or
+                        now - last_port_scan >= USB_RESCAN_INTERVAL):
+                    last_port_scan = now
+                    self.check_pico_port()
                 
             except Exception as e:
                 self.log(f"USB monitoring error: {e}", "ERROR")
             
+            if tty_monitor:
+                try:
+                    tty_changed = tty_monitor.poll(timeout=1) is not None
+                    while tty_changed and tty_monitor.poll(timeout=0) is not None:
+                        pass  # Coalesce bursts of events into one rescan
+                    continue
+                except Exception as e:
+                    # Keep the thread alive and fall back to plain polling
+                    self.log(f"udev monitoring failed, polling instead: {e}", "WARNING")
+                    tty_monitor = None
             time.sleep(1)
     
+    def create_tty_monitor(self):
+        """Open a udev monitor for tty add/remove events (Linux with pyudev)"""
+        if pyudev is None:
+            return None
+        try:
+            monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+            monitor.filter_by('tty')
+            monitor.start()
+            return monitor
+        except Exception as e:
+            self.log(f"udev monitoring unavailable, polling instead: {e}", "DEBUG")
+            return None
+    
+    def check_pico_port(self):
+        """Scan serial ports and update the connection state"""
+        ports = serial.tools.list_ports.comports()
+        
+        # Nothing to re-match while the same ports are attached
+        signature = frozenset((port.device, port.hwid) for port in ports)
+        if signature == self.ports_signature:
+            return
+        self.ports_signature = signature
+        
+        pico_port = None
+        pico_pid = None
+        pico_id = None
+        
+        # Match on the USB vendor ID first, an integer compare per port
+        for port in ports:
+            if port.vid == PICO_VID:
+                pico_port = port.device
+                pico_pid = port.pid
+                pico_id = port.serial_number or port.device
+                break
+        else:
+            # Ports without USB IDs can only be recognised by their description
+            for port in ports:
+                if port.vid is None and 'pico' in (port.description or '').casefold():
+                    pico_port = port.device
+                    pico_id = port.device
+                    break
+        
+        if pico_port and not self.pico_connected:
+            # Pico connected
+            self.current_port = pico_port
+            self.current_pid = pico_pid
+            self.current_device_id = pico_id
+            self.pico_connected = True
+            self.root.after(0, self.on_pico_connected)
+        elif not pico_port and self.pico_connected:
+            # Pico disconnected
+            self.pico_connected = False
+            self.current_port = None
+            self.current_pid = None
+            self.current_device_id = None
+            self.root.after(0, self.on_pico_disconnected)
+    
     def find_bootsel_drive(self):
         """Find Pico in BOOTSEL mode"""
         # Windows drives
@@ -612,25 +785,21 @@ class PicoSyncManager:
                     filename = "RPI_PICO-latest.uf2"
                 
                 self.log(f"Downloading {filename}...", "INFO")
-                
-                import urllib.request
-                urllib.request.urlretrieve(url, filename)
+
+                firmware = self.download_file(url)
                 self.log(f"Downloaded {filename}", "SUCCESS")
-                
+
                 # Copy firmware to BOOTSEL drive
                 self.root.after(0, lambda: self.operation_label.config(text="Flashing firmware..."))
-                shutil.copy2(filename, drive)
+                self.write_firmware(firmware, drive, filename)
                 self.log("Firmware flashed successfully!", "SUCCESS")
                 
-                # Clean up
-                os.remove(filename)
-                
                 self.root.after(0, lambda: messagebox.showinfo("Success", 
                                           "Firmware flashed! Pico will reboot automatically."))
                 
             except Exception as e:
                 self.log(f"Flash error: {e}", "ERROR")
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to flash firmware: {e}"))
+                self.root.after(0, lambda e=e: messagebox.showerror("Error", f"Failed to flash firmware: {e}"))
             finally:
                 self.root.after(0, self.progress_bar.stop)
                 self.root.after(0, lambda: self.operation_label.config(text="Idle"))
@@ -640,6 +809,7 @@ class PicoSyncManager:
     def on_pico_connected(self):
         """Handle Pico connection"""
         self.log("Pico connected!", "SUCCESS")
+        self.synced_hashes.clear()  # May be a different board
         self.update_status("Connected", "#00ff00")
         
         # Enable buttons
@@ -677,6 +847,7 @@ class PicoSyncManager:
     def on_pico_disconnected(self):
         """Handle Pico disconnection"""
         self.log("Pico disconnected", "WARNING")
+        self.synced_hashes.clear()
         self.update_status("Disconnected", "#ff0000")
         self.model_label.config(text="")
         
@@ -696,7 +867,7 @@ class PicoSyncManager:
         """Detect if it's RP2040 or RP2350"""
         try:
             # Try to get info from the Pico
-            result = subprocess.run(['mpremote', 'connect', 'auto', 'exec', 
+            result = subprocess.run([self.find_mpremote(), 'connect', 'auto', 'exec', 
                                    'import sys; print(sys.implementation.name)'],
                                   capture_output=True, text=True, timeout=5)
             
@@ -711,11 +882,37 @@ class PicoSyncManager:
         except:
             self.model_label.config(text="Model Detection Failed")
     
+    def find_mpremote(self):
+        """Locate the mpremote executable, caching it for the session"""
+        if self.mpremote_cmd:
+            return self.mpremote_cmd
+            
+        exe_name = 'mpremote.exe' if self.is_windows else 'mpremote'
+        found = shutil.which('mpremote')
+        if not found:
+            # Fall back to the scripts folder of the running interpreter or cwd
+            for candidate in (Path(sys.executable).parent / exe_name,
+                              Path.cwd() / 'Scripts' / 'mpremote.exe'):
+                if candidate.exists():
+                    found = str(candidate)
+                    break
+                    
+        if not found:
+            return 'mpremote'  # Not cached so a later install is picked up
+            
+        self.mpremote_cmd = found
+        return self.mpremote_cmd
+    
     def check_micropython(self):
         """Check if MicroPython is installed on Pico"""
+        # The official MicroPython product ID answers it without opening a
+        # REPL. Third-party RP2040/RP2350 boards keep their own product IDs
+        # under MicroPython, so anything else still gets the mpremote probe
+        if self.current_pid == MICROPYTHON_PID:
+            return True
+            
         try:
-            mpremote_cmd = 'mpremote' if shutil.which('mpremote') else str(Path.cwd() / 'Scripts' / 'mpremote.exe')
-            result = subprocess.run([mpremote_cmd, 'connect', self.current_port or 'auto', 'ls'],
+            result = subprocess.run([self.find_mpremote(), 'connect', self.current_port or 'auto', 'ls'],
                                   capture_output=True, text=True, timeout=5)
             if result.stderr:
                 self.log(f"MicroPython check stderr: {result.stderr}", "DEBUG")
@@ -780,15 +977,23 @@ class PicoSyncManager:
     def stop_file_watching(self):
         """Stop watching directory"""
         if self.file_observer and self.file_observer.is_alive():
-            self.file_observer.stop()
-            self.file_observer.join()
+            observer = self.file_observer
             self.file_observer = None
+            observer.stop()
+            # Join off the Tk thread: a handler inside log() may be waiting on Tk
+            threading.Thread(target=observer.join, daemon=True).start()
             self.log("Stopped file watching", "INFO")
     
     def on_file_changed(self, filepath):
         """Handle file change event"""
         self.log(f"File changed: {os.path.basename(filepath)}", "INFO")
-        self.sync_queue.put(('file', filepath))
+        
+        # Coalesce bursts of changes into one queued sync
+        with self.dirty_lock:
+            already_queued = bool(self.dirty_files)
+            self.dirty_files.add(filepath)
+        if not already_queued:
+            self.sync_queue.put(('dirty', None))
     
     def manual_sync(self):
         """Manually sync all files"""
@@ -797,15 +1002,16 @@ class PicoSyncManager:
                                  "Please select a directory to sync first")
             return
         
-        self.sync_all_files()
+        # Copy everything, even files the manifest says are already there
+        self.sync_all_files(force=True)
     
-    def sync_all_files(self):
+    def sync_all_files(self, force=False):
         """Sync all files in directory"""
         if not self.dir_var.get():
             return
         
         self.log("Starting full sync...", "INFO")
-        self.sync_queue.put(('full', self.dir_var.get()))
+        self.sync_queue.put(('full', (self.dir_var.get(), force)))
     
     def process_sync_queue(self):
         """Process file sync queue in background"""
@@ -815,8 +1021,10 @@ class PicoSyncManager:
                 
                 if sync_type == 'file':
                     self.sync_single_file(data)
+                elif sync_type == 'dirty':
+                    self.sync_dirty_files()
                 elif sync_type == 'full':
-                    self.sync_directory(data)
+                    self.sync_directory(*data)
                 
             except queue.Empty:
                 continue
@@ -829,14 +1037,22 @@ class PicoSyncManager:
             return
         
         filename = os.path.basename(filepath)
+        
+        # Always copy on an explicit upload; the digest only lets later
+        # watcher syncs skip the file while it stays unchanged
+        try:
+            digest = file_digest(filepath)
+        except OSError as e:
+            self.log(f"Failed to read {filename}: {e}", "ERROR")
+            return
+        
         self.root.after(0, lambda: self.operation_label.config(
             text=f"Syncing {filename}..."))
         self.root.after(0, self.progress_bar.start)
         
         try:
-            subprocess.run(['mpremote', 'connect', 'auto', 'cp', 
-                          filepath, f':{filename}'],
-                         check=True, capture_output=True, text=True)
+            self.copy_to_pico(filepath)
+            self.synced_hashes[filepath] = digest
             self.log(f"Synced: {filename}", "SUCCESS")
             self.root.after(0, self.refresh_files)
         except subprocess.CalledProcessError as e:
@@ -845,8 +1061,94 @@ class PicoSyncManager:
             self.root.after(0, self.progress_bar.stop)
             self.root.after(0, lambda: self.operation_label.config(text="Idle"))
     
-    def sync_directory(self, directory):
-        """Sync entire directory to Pico"""
+    def sync_dirty_files(self):
+        """Sync every watched file changed since the last sync in one pass"""
+        with self.dirty_lock:
+            filepaths = sorted(self.dirty_files)
+            self.dirty_files.clear()
+        
+        if not self.pico_connected:
+            return
+        
+        # Drop files that vanished or whose contents match the last copy
+        changed = {}
+        signatures = {}
+        for filepath in filepaths:
+            try:
+                signatures[filepath] = file_signature(filepath)
+                digest = file_digest(filepath)
+            except OSError:
+                continue
+            if self.synced_hashes.get(filepath) != digest:
+                changed[filepath] = digest
+        
+        if not changed:
+            return
+        
+        self.root.after(0, lambda n=len(changed): self.operation_label.config(
+            text=f"Syncing {n} changed file(s)..."))
+        self.root.after(0, self.progress_bar.start)
+        
+        try:
+            copied = []
+            for batch in batch_by_length(changed):
+                copied += self.copy_batch(batch)
+            for filepath in copied:
+                self.synced_hashes[filepath] = changed[filepath]
+            self.root.after(0, self.update_manifest, self.current_device_id,
+                            {filepath: signatures[filepath] for filepath in copied})
+            self.root.after(0, self.refresh_files)
+        finally:
+            self.root.after(0, self.progress_bar.stop)
+            self.root.after(0, lambda: self.operation_label.config(text="Idle"))
+    
+    def update_manifest(self, device_id, signatures):
+        """Record files copied to a board so later syncs can skip them (Tk thread)"""
+        if not device_id or not signatures:
+            return
+        self.config.setdefault('manifest', {}).setdefault(device_id, {}).update(signatures)
+        self.schedule_save()  # Persist only the manifest, not unsaved settings
+    
+    def forget_synced_files(self):
+        """Drop what we know is on the board after its files were removed (Tk thread)"""
+        self.synced_hashes.clear()
+        if self.config.get('manifest', {}).pop(self.current_device_id, None) is not None:
+            self.schedule_save()
+    
+    def copy_batch(self, filepaths):
+        """Copy files in one mpremote call, falling back to one at a time; returns those copied"""
+        try:
+            self.copy_to_pico(*filepaths)
+            for filepath in filepaths:
+                self.log(f"Synced: {os.path.basename(filepath)}", "SUCCESS")
+            return filepaths
+        except subprocess.CalledProcessError:
+            pass
+        
+        # Retry one by one so a single bad file doesn't fail the batch
+        copied = []
+        for filepath in filepaths:
+            filename = os.path.basename(filepath)
+            try:
+                self.copy_to_pico(filepath)
+                self.log(f"Synced: {filename}", "SUCCESS")
+                copied.append(filepath)
+            except subprocess.CalledProcessError as e:
+                self.log(f"Failed to sync {filename}: {e}", "ERROR")
+        return copied
+    
+    def copy_to_pico(self, *filepaths):
+        """Copy local files to the root of the Pico filesystem"""
+        # The Pico exposes a single serial port that only one mpremote can
+        # hold at a time, so copies stay sequential on the sync thread and
+        # are chained with "+" to share one connection
+        cmd = [self.find_mpremote(), 'connect', 'auto']
+        for filepath in filepaths:
+            cmd += ['cp', str(filepath), f':{os.path.basename(filepath)}', '+']
+        subprocess.run(cmd[:-1], check=True, capture_output=True, text=True)
+    
+    def sync_directory(self, directory, force=False):
+        """Sync entire directory to Pico, skipping files unchanged since the last sync unless forced"""
         if not self.pico_connected:
             return
         
@@ -860,12 +1162,26 @@ class PicoSyncManager:
             files = []
             
             if self.config.get('sync_subdirs', True):
-                for root, dirs, filenames in os.walk(directory):
-                    for filename in filenames:
-                        if filename.endswith('.py'):
-                            files.append(os.path.join(root, filename))
+                files = [path for path in iter_files(directory) if path.endswith('.py')]
             else:
-                files = [f for f in Path(directory).glob(pattern) if f.is_file()]
+                with os.scandir(directory) as entries:
+                    files = [entry.path for entry in entries
+                             if fnmatch.fnmatch(entry.name, pattern) and entry.is_file()]
+            
+            # Only copy files whose size or mtime differ from the last sync to this board
+            device_id = self.current_device_id
+            manifest = self.config.get('manifest', {}).get(device_id, {})
+            signatures = {}
+            for path in files:
+                try:
+                    signatures[path] = file_signature(path)
+                except OSError:
+                    continue
+            unchanged = 0
+            if not force:
+                unchanged = len(files)
+                files = [path for path in signatures if manifest.get(path) != signatures[path]]
+                unchanged -= len(files)
             
             # Clear queue display and add files
             self.root.after(0, lambda: self.queue_listbox.delete(0, tk.END))
@@ -873,30 +1189,30 @@ class PicoSyncManager:
                 self.root.after(0, lambda f=f: self.queue_listbox.insert(
                     tk.END, os.path.basename(f)))
             
-            # Sync each file
+            # Sync files in as few mpremote calls as the command line allows,
+            # since each call pays for a fresh connection and raw REPL entry
             total = len(files)
-            for i, filepath in enumerate(files):
+            start = 0
+            for batch in batch_by_length(files):
                 if not self.pico_connected:
                     break
                 
-                filename = os.path.basename(filepath)
-                self.root.after(0, lambda f=filename, i=i, t=total: 
+                self.root.after(0, lambda i=start, n=len(batch), t=total: 
                               self.operation_label.config(
-                                  text=f"Syncing {f} ({i+1}/{t})..."))
+                                  text=f"Syncing files {i+1}-{i+n} of {t}..."))
                 
-                try:
-                    subprocess.run(['mpremote', 'connect', 'auto', 'cp', 
-                                  str(filepath), f':{filename}'],
-                                 check=True, capture_output=True, text=True)
-                    self.log(f"Synced: {filename}", "SUCCESS")
-                    
-                    # Remove from queue display
-                    self.root.after(0, lambda: self.queue_listbox.delete(0))
-                    
-                except subprocess.CalledProcessError as e:
-                    self.log(f"Failed to sync {filename}: {e}", "ERROR")
+                copied = self.copy_batch(batch)
+                self.root.after(0, self.update_manifest, device_id,
+                                {path: signatures[path] for path in copied if path in signatures})
+                
+                # Remove from queue display
+                self.root.after(0, lambda n=len(batch): self.queue_listbox.delete(0, n - 1))
+                start += len(batch)
             
-            self.log(f"Directory sync complete: {total} files", "INFO")
+            if unchanged:
+                self.log(f"Directory sync complete: {total} files ({unchanged} unchanged, skipped)", "INFO")
+            else:
+                self.log(f"Directory sync complete: {total} files", "INFO")
             self.root.after(0, self.refresh_files)
             
         except Exception as e:
@@ -963,55 +1279,145 @@ class PicoSyncManager:
         instructions.config(state=tk.DISABLED)
     
     def download_and_flash(self, url):
-        """Download and flash firmware"""
-        self.operation_label.config(text="Downloading firmware...")
-        self.progress_bar.start()
+        """Download and flash firmware (runs in a worker thread)"""
+        self.root.after(0, lambda: self.operation_label.config(text="Downloading firmware..."))
+        self.root.after(0, self.progress_bar.start)
         
         try:
-            # Download firmware
             filename = url.split('/')[-1]
-            self.log(f"Downloading {filename}...", "INFO")
-            
-            import urllib.request
-            urllib.request.urlretrieve(url, filename)
-            self.log(f"Downloaded {filename}", "SUCCESS")
             
-            # Prompt for BOOTSEL mode
-            self.root.after(0, lambda: messagebox.showinfo(
-                "Enter BOOTSEL Mode",
-                "1. Disconnect your Pico\n"
-                "2. Hold the BOOTSEL button\n"
-                "3. Reconnect while holding BOOTSEL\n"
-                "4. Release after 2 seconds\n\n"
-                "Click OK when ready"))
+            def fetch():
+                self.log(f"Downloading {filename}...", "INFO")
+                firmware = self.download_file(url)
+                self.log(f"Downloaded {filename}", "SUCCESS")
+                self.root.after(0, lambda: self.operation_label.config(text="Waiting for BOOTSEL mode..."))
+                return firmware
             
-            # Wait for BOOTSEL drive
-            self.operation_label.config(text="Waiting for BOOTSEL mode...")
-            bootsel_drive = self.wait_for_bootsel()
+            # Download while the user puts the Pico into BOOTSEL mode
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                download = executor.submit(fetch)
+                
+                # Prompt for BOOTSEL mode
+                self.root.after(0, lambda: messagebox.showinfo(
+                    "Enter BOOTSEL Mode",
+                    "1. Disconnect your Pico\n"
+                    "2. Hold the BOOTSEL button\n"
+                    "3. Reconnect while holding BOOTSEL\n"
+                    "4. Release after 2 seconds\n\n"
+                    "Click OK when ready"))
+                
+                # Wait for BOOTSEL drive
+                bootsel_drive = self.wait_for_bootsel()
+                firmware = download.result()
             
             if bootsel_drive:
                 # Copy firmware
-                self.operation_label.config(text="Flashing firmware...")
-                import shutil
-                shutil.copy2(filename, bootsel_drive)
+                self.root.after(0, lambda: self.operation_label.config(text="Flashing firmware..."))
+                self.write_firmware(firmware, bootsel_drive, filename)
                 self.log("Firmware flashed successfully!", "SUCCESS")
                 
-                # Clean up
-                os.remove(filename)
-                
-                messagebox.showinfo("Success", 
-                                  "Firmware flashed! Pico will reboot automatically.")
+                self.root.after(0, lambda: messagebox.showinfo("Success", 
+                                  "Firmware flashed! Pico will reboot automatically."))
             else:
                 self.log("Could not find BOOTSEL drive", "ERROR")
-                messagebox.showerror("Error", "Could not detect Pico in BOOTSEL mode")
+                self.root.after(0, lambda: messagebox.showerror(
+                    "Error", "Could not detect Pico in BOOTSEL mode"))
                 
         except Exception as e:
             self.log(f"Flash error: {e}", "ERROR")
-            messagebox.showerror("Error", f"Failed to flash firmware: {e}")
+            self.root.after(0, lambda e=e: messagebox.showerror("Error", f"Failed to flash firmware: {e}"))
         finally:
+            self.root.after(0, self.progress_bar.stop)
+            self.root.after(0, lambda: self.operation_label.config(text="Idle"))
+
+    def download_file(self, url, retries=3):
+        """Download a file into memory, resuming with a Range request if the connection drops"""
+        import urllib.request
+        import urllib.error
+        import http.client
+
+        downloaded = 0
+        total = 0
+        last_update = 0
+        validator = None
+        try:
+            with io.BytesIO() as f:
+                for attempt in range(retries):
+                    request = urllib.request.Request(url)
+                    if downloaded and validator:
+                        # Only accept the rest of the same build; a new release
+                        # published in between comes back as a full 200 instead
+                        request.add_header('Range', f'bytes={downloaded}-')
+                        request.add_header('If-Range', validator)
+
+                    try:
+                        with urllib.request.urlopen(request, timeout=30) as response:
+                            content_range = response.headers.get('Content-Range', '')
+                            if not (response.status == 206 and
+                                    content_range.startswith(f'bytes {downloaded}-')):
+                                # Not a continuation of what we have, start over
+                                f.seek(0)
+                                f.truncate()
+                                downloaded = 0
+                                total = int(response.headers.get('Content-Length', 0))
+                                # Resume against the file the -latest link resolved
+                                # to, not whatever it points at by the next attempt
+                                url = response.geturl()
+                                etag = response.headers.get('ETag', '')
+                                validator = (etag if etag and not etag.startswith('W/')
+                                             else response.headers.get('Last-Modified'))
+
+                            while True:
+                                chunk = response.read(256 * 1024)
+                                if not chunk:
+                                    break
+                                f.write(chunk)
+                                downloaded += len(chunk)
+                                
+                                # Redraw at most every 100 ms rather than per chunk
+                                now = time.monotonic()
+                                if now - last_update >= 0.1:
+                                    last_update = now
+                                    self.root.after(0, self.update_download_progress, downloaded, total)
+
+                        if total and downloaded < total:
+                            raise http.client.IncompleteRead(b'', total - downloaded)
+                        self.root.after(0, self.update_download_progress, downloaded, total)
+                        break
+                    except urllib.error.HTTPError:
+                        raise
+                    except (OSError, http.client.HTTPException) as e:
+                        if attempt == retries - 1:
+                            raise
+                        self.log(f"Download interrupted ({e}), resuming at {downloaded} bytes", "WARNING")
+                return f.getvalue()
+        finally:
+            self.root.after(0, self.end_download_progress)
+
+    def write_firmware(self, data, drive, filename):
+        """Write a UF2 image onto the BOOTSEL drive in one write call"""
+        # The Pico reboots as soon as the last block lands, so skip the
+        # extra metadata writes shutil.copy2 would make afterwards. The
+        # buffered writer passes a large write straight through and loops
+        # until every byte is written, unlike a raw FileIO.write
+        with open(os.path.join(drive, filename), 'wb') as f:
+            f.write(data)
+
+    def update_download_progress(self, downloaded, total):
+        """Show download progress in the progress bar"""
+        if not total:
+            return
+        if str(self.progress_bar.cget('mode')) != 'determinate':
             self.progress_bar.stop()
-            self.operation_label.config(text="Idle")
-    
+            self.progress_bar.config(mode='determinate', maximum=total)
+        self.progress_bar.config(value=downloaded)
+        self.operation_label.config(text=f"Downloading firmware... {downloaded * 100 // total}%")
+
+    def end_download_progress(self):
+        """Put the progress bar back into busy mode after a download"""
+        self.progress_bar.config(mode='indeterminate', value=0)
+        self.progress_bar.start()
+
     def wait_for_bootsel(self):
         """Wait for Pico to appear in BOOTSEL mode"""
         for _ in range(60):  # Wait up to 60 seconds
@@ -1048,13 +1454,14 @@ class PicoSyncManager:
             
             def do_wipe():
                 try:
-                    result = subprocess.run(['mpremote', 'connect', 'auto', 
+                    result = subprocess.run([self.find_mpremote(), 'connect', 'auto', 
                                           'exec', 'import os; '
                                           '[os.remove(f) for f in os.listdir() '
                                           'if os.stat(f)[0] & 0x8000]'],
                                           capture_output=True, text=True)
                     
                     if result.returncode == 0:
+                        self.root.after(0, self.forget_synced_files)
                         self.log("Pico wiped successfully", "SUCCESS")
                         self.root.after(0, self.refresh_files)
                     else:
@@ -1071,7 +1478,7 @@ class PicoSyncManager:
     def reset_pico(self):
         """Reset the Pico"""
         try:
-            subprocess.run(['mpremote', 'connect', 'auto', 'reset'],
+            subprocess.run([self.find_mpremote(), 'connect', 'auto', 'reset'],
                          check=True, capture_output=True)
             self.log("Pico reset", "INFO")
         except subprocess.CalledProcessError as e:
@@ -1090,15 +1497,18 @@ class PicoSyncManager:
             return
         
         try:
-            path = Path(self.dir_var.get())
-            for item in sorted(path.iterdir()):
+            with os.scandir(self.dir_var.get()) as entries:
+                items = sorted(entries, key=lambda entry: entry.name)
+            
+            for item in items:
                 if item.name.startswith('.'):
                     continue
                 
-                if item.is_file() and item.suffix == '.py':
-                    size = f"{item.stat().st_size} bytes"
+                if item.name.endswith('.py') and item.is_file():
+                    stat = item.stat()
+                    size = f"{stat.st_size} bytes"
                     modified = datetime.fromtimestamp(
-                        item.stat().st_mtime).strftime("%Y-%m-%d %H:%M")
+                        stat.st_mtime).strftime("%Y-%m-%d %H:%M")
                     
                     self.local_tree.insert('', 'end', text=item.name,
                                          values=(size, modified))
@@ -1114,7 +1524,7 @@ class PicoSyncManager:
         
         def do_refresh():
             try:
-                result = subprocess.run(['mpremote', 'connect', 'auto', 'ls'],
+                result = subprocess.run([self.find_mpremote(), 'connect', 'auto', 'ls'],
                                       capture_output=True, text=True)
                 
                 if result.returncode == 0:
@@ -1158,9 +1568,10 @@ class PicoSyncManager:
             for item in selected:
                 filename = self.pico_tree.item(item)['text']
                 try:
-                    subprocess.run(['mpremote', 'connect', 'auto', 'rm', 
+                    subprocess.run([self.find_mpremote(), 'connect', 'auto', 'rm', 
                                   f':{filename}'], check=True, capture_output=True)
                     self.log(f"Deleted: {filename}", "INFO")
+                    self.forget_synced_files()
                 except subprocess.CalledProcessError as e:
                     self.log(f"Failed to delete {filename}: {e}", "ERROR")
             
@@ -1196,38 +1607,78 @@ class PicoSyncManager:
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         log_entry = f"[{timestamp}] [{level}] {message}\n"
         
-        # Queue log entry for thread-safe display
-        self.log_queue.put(log_entry)
+        # Queue log entry for thread-safe display, dropping the oldest
+        # entry rather than growing without bound if the UI falls behind
+        while True:
+            try:
+                self.log_queue.put_nowait(log_entry)
+                break
+            except queue.Full:
+                try:
+                    self.log_queue.get_nowait()
+                except queue.Empty:
+                    pass
+        
+        # Wake the Tk thread to display it instead of polling the queue. From
+        # a worker thread this is a round trip to Tk, so only the first entry
+        # since the last drain pays for it
+        with self.log_wake_lock:
+            wake = not self.log_wake_pending
+            self.log_wake_pending = True
+        if wake:
+            try:
+                self.root.event_generate("<<LogEvent>>", when="tail")
+            except (tk.TclError, RuntimeError):
+                # Window is closing or the main loop isn't running yet. Let
+                # the next entry try again rather than never waking Tk
+                with self.log_wake_lock:
+                    self.log_wake_pending = False
         
         # Also write to file
-        try:
-            with open(LOG_FILE, 'a') as f:
-                f.write(log_entry)
-        except:
-            pass
+        with self.log_lock:
+            if self.log_file:
+                try:
+                    self.log_file.write(log_entry)
+                except (OSError, ValueError):
+                    pass
     
     def process_logs(self):
         """Process log queue and update display"""
+        # Clear before draining so entries queued from here on raise a new event
+        with self.log_wake_lock:
+            self.log_wake_pending = False
+        
+        entries = []
         try:
             while True:
-                log_entry = self.log_queue.get_nowait()
-                self.log_text.insert(tk.END, log_entry)
-                self.log_text.see(tk.END)
-                
-                # Limit log size
-                if int(self.log_text.index('end-1c').split('.')[0]) > 1000:
-                    self.log_text.delete('1.0', '100.0')
-                    
+                entries.append(self.log_queue.get_nowait())
         except queue.Empty:
             pass
+            
+        if not entries:
+            return
+            
+        # One insert and one scroll per drain instead of per entry
+        self.log_text.insert(tk.END, ''.join(entries))
+        self.log_text.see(tk.END)
         
-        # Schedule next check
-        self.root.after(100, self.process_logs)
+        # Limit log size, trimming everything above the last lines in one delete
+        if int(self.log_text.index('end-1c').split('.')[0]) > LOG_MAX_LINES:
+            self.log_text.delete('1.0', f'end-{LOG_MAX_LINES}l')
     
     def on_closing(self):
         """Handle window closing"""
         self.stop_file_watching()
+        
+        # Flush any pending debounced write before the window goes away
         self.save_config()
+        self.root.after_cancel(self.save_after_id)
+        self.write_config()
+        
+        with self.log_lock:
+            if self.log_file:
+                self.log_file.close()
+                self.log_file = None
         self.root.destroy()
 
 def main():
@@ -1235,7 +1686,7 @@ def main():
     root = tk.Tk()
     
     # Set DPI awareness on Windows
-    if platform.system() == 'Windows':
+    if sys.platform == 'win32':
         try:
             from ctypes import windll
             windll.shcore.SetProcessDpiAwareness(1)
@@ -12,19 +12,23 @@ def create_shortcut(shortcut_path_str, target_path_str, working_dir_str, icon_pa
         shortcut.IconLocation = icon_path_str
     shortcut.save()
 
+def create_shortcuts(shortcut_path, target_path, working_dir, run_icon_path, install_icon_path):
+    """Create the PicoSync shortcut and the matching installer shortcut"""
+    create_shortcut(shortcut_path, target_path, working_dir, run_icon_path)
+    # Also create a shortcut for the installer
+    install_shortcut_path = str(Path(shortcut_path).parent / "PicoSync Installer.lnk")
+    install_target_path = str(Path(target_path).parent / "install_picosync.bat")
+    create_shortcut(install_shortcut_path, install_target_path, working_dir, install_icon_path)
+
 if __name__ == "__main__":
-    if len(sys.argv) != 7:
+    if len(sys.argv) != 6:
         print("Usage: python create_shortcut_windows.py <shortcut_path> <target_path> <working_dir> <run_icon_path> <install_icon_path>")
         sys.exit(1)
-    
+
     shortcut_path = sys.argv[1]
     target_path = sys.argv[2]
     working_dir = sys.argv[3]
     run_icon_path = sys.argv[4]
     install_icon_path = sys.argv[5]
-    
-    create_shortcut(shortcut_path, target_path, working_dir, run_icon_path)
-    # Also create a shortcut for the installer
-    install_shortcut_path = str(Path(shortcut_path).parent / "PicoSync Installer.lnk")
-    install_target_path = str(Path(target_path).parent.parent / "install_picosync.bat")
-    create_shortcut(install_shortcut_path, install_target_path, working_dir, install_icon_path)
+
+    create_shortcuts(shortcut_path, target_path, working_dir, run_icon_path, install_icon_path)
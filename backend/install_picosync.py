@@ -7,20 +7,46 @@ Automatically sets up environment and installs dependencies
 import os
 import sys
 import subprocess
-import platform
 import shutil
 import json
 from pathlib import Path
 
+# Linux application menu entry, filled in by create_shortcuts
+DESKTOP_ENTRY_TEMPLATE = """[Desktop Entry]
+Version=1.0
+Type=Application
+Name=PicoSync
+Comment=Raspberry Pi Pico Sync Manager
+Exec={base_dir}/run_picosync.sh
+Icon={core_dir}/icon.ico
+Terminal=false
+Categories=Development;IDE;
+"""
+
 class PicoSyncInstaller:
     def __init__(self):
         self.base_dir = Path(__file__).parent.resolve()
         self.config_dir = self.base_dir / "config"
         self.core_dir = self.config_dir / "core"
         self.venv_dir = self.base_dir / "pico_venv"
-        self.system = platform.system()
-        self.is_windows = self.system == "Windows"
-        self.is_linux = self.system == "Linux"
+        
+        # sys.platform is a constant; platform.system() costs an import and may run uname
+        self.is_windows = sys.platform == "win32"
+        self.is_linux = sys.platform.startswith("linux")
+        if self.is_windows:
+            self.system = "Windows"
+        elif self.is_linux:
+            self.system = "Linux"
+        elif sys.platform == "darwin":
+            self.system = "Darwin"
+        else:
+            self.system = sys.platform
+        self.home = Path.home()
+
+        if self.is_windows:
+            self.venv_python = self.venv_dir / "Scripts" / "python.exe"
+        else:
+            self.venv_python = self.venv_dir / "bin" / "python"
         
         # UV executable paths
         self.uv_cmd = self.find_uv()
@@ -33,7 +59,7 @@ class PicoSyncInstaller:
             return uv_cmd
             
         # Check common locations
-        home = Path.home()
+        home = self.home
         locations = [
             home / ".cargo" / "bin" / "uv",
             home / ".local" / "bin" / "uv",
@@ -79,69 +105,128 @@ class PicoSyncInstaller:
         if not self.uv_cmd:
             # Try to add to PATH and check again
             if self.is_windows:
-                os.environ["PATH"] = f"{Path.home()}/.cargo/bin;{os.environ['PATH']}"
+                os.environ["PATH"] = f"{self.home}/.cargo/bin;{os.environ['PATH']}"
             else:
-                os.environ["PATH"] = f"{Path.home()}/.cargo/bin:{os.environ['PATH']}"
+                os.environ["PATH"] = f"{self.home}/.cargo/bin:{os.environ['PATH']}"
             self.uv_cmd = self.find_uv()
             
         return self.uv_cmd is not None
         
+    def venv_is_usable(self):
+        """Check that an existing venv still points at an installed Python"""
+        pyvenv_cfg = self.venv_dir / "pyvenv.cfg"
+        if not self.venv_python.exists() or not pyvenv_cfg.exists():
+            return False
+            
+        home_exists = False
+        for line in pyvenv_cfg.read_text().splitlines():
+            key, _, value = line.partition("=")
+            if key.strip() == "home":
+                home_exists = Path(value.strip()).exists()
+                break
+        if not home_exists:
+            return False
+            
+        # Without uv, dependencies go through the venv's own pip, which a
+        # venv made by "uv venv" doesn't have
+        if not self.uv_cmd:
+            result = subprocess.run([str(self.venv_python), "-m", "pip", "--version"],
+                                    capture_output=True, text=True)
+            return result.returncode == 0
+        return True
+        
     def setup_virtual_environment(self):
-        """Create virtual environment using UV"""
+        """Create virtual environment using UV, or the venv module without it"""
         print("\nSetting up Python virtual environment...")
         
+        # Keep a working venv so reinstalls only top up missing packages
+        if self.venv_is_usable():
+            print("✅ Reusing existing virtual environment")
+            return True
+            
         # Remove old venv if exists
         if self.venv_dir.exists():
             print("Removing old virtual environment...")
             shutil.rmtree(self.venv_dir)
             
-        # Create new venv with UV
-        cmd = [self.uv_cmd, "venv", str(self.venv_dir)]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            print(f"Failed to create virtual environment: {result.stderr}")
-            return False
+        if self.uv_cmd:
+            # Create new venv with UV
+            cmd = [self.uv_cmd, "venv", str(self.venv_dir)]
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            
+            if result.returncode != 0:
+                print(f"Failed to create virtual environment: {result.stderr}")
+                return False
+        else:
+            # Build the venv in-process rather than spawning "python -m venv"
+            import venv
+            builder = venv.EnvBuilder(with_pip=True, symlinks=not self.is_windows)
+            try:
+                builder.create(str(self.venv_dir))
+            except Exception as e:
+                print(f"Failed to create virtual environment: {e}")
+                return False
             
         print("✅ Virtual environment created successfully!")
         return True
         
     def install_dependencies(self):
-        """Install dependencies using UV"""
+        """Install dependencies using UV, or the venv's pip without it"""
         print("\n📥 Installing dependencies...")
         
-        requirements_file = self.core_dir / "requirements.txt"
+        # requirements.txt lives in the repository root, next to the launchers
+        requirements_file = self.base_dir.parent / "requirements.txt"
         if not requirements_file.exists():
             print("❌ requirements.txt not found!")
             return False
             
-        # Install with UV
-        cmd = [self.uv_cmd, "pip", "install", "-r", str(requirements_file)]
+        if self.uv_cmd:
+            # Install with UV
+            pip_cmd = [self.uv_cmd, "pip", "install"]
+        else:
+            pip_cmd = [str(self.venv_python), "-m", "pip", "install", "--disable-pip-version-check"]
+        cmd = pip_cmd + ["-r", str(requirements_file)]
         
         # Set VIRTUAL_ENV for UV to use our venv
         env = os.environ.copy()
         env["VIRTUAL_ENV"] = str(self.venv_dir)
         
-        result = subprocess.run(cmd, env=env, capture_output=True, text=True)
+        # Resolve pywin32 (for shortcut icons) in the same run on Windows
+        # rather than paying for a second installer process
+        if self.is_windows:
+            result = subprocess.run(cmd + ["pywin32"], env=env, capture_output=True, text=True)
+            if result.returncode != 0:
+                print("⚠️  Failed to install pywin32 (shortcuts will not have icons)")
+                result = subprocess.run(cmd, env=env, capture_output=True, text=True)
+        else:
+            result = subprocess.run(cmd, env=env, capture_output=True, text=True)
         
         if result.returncode != 0:
             print(f"Failed to install dependencies: {result.stderr}")
             return False
             
-        # Install pywin32 on Windows for icon support
-        if self.is_windows:
-            print("\n📦 Installing pywin32 for icon support...")
-            cmd_pywin32 = [self.uv_cmd, "pip", "install", "pywin32"]
-            result_pywin32 = subprocess.run(cmd_pywin32, env=env, capture_output=True, text=True)
-            
-            if result_pywin32.returncode != 0:
-                print("⚠️  Failed to install pywin32 (shortcuts will not have icons)")
-            else:
-                print("✅ pywin32 installed successfully!")
-            
         print("✅ Dependencies installed successfully!")
         return True
         
+    def compile_bytecode(self):
+        """Start pre-compiling the venv so the first launch skips .pyc generation"""
+        print("\n⚙️  Compiling Python bytecode in the background...")
+        
+        # -j 0 uses one worker per CPU; the app runs without -O so plain .pyc is what it loads.
+        # core_dir is left out: pico_sync_manager.py runs as __main__, which never loads from __pycache__
+        cmd = [str(self.venv_python), "-m", "compileall", "-q", "-j", "0", str(self.venv_dir)]
+        try:
+            return subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError:
+            return None
+            
+    def finish_bytecode(self, process):
+        """Wait for the background bytecode compilation and report how it went"""
+        if process is None or process.wait() != 0:
+            print("⚠️  Bytecode compilation failed (first launch will be slower)")
+        else:
+            print("✅ Bytecode compiled!")
+        
     def create_config_file(self):
         """Create configuration file with paths"""
         config = {
@@ -156,6 +241,12 @@ class PicoSyncInstaller:
         config_file = self.base_dir / "picosync_config.json"
         with open(config_file, "w") as f:
             json.dump(config, f, indent=2)
+        
+        # Same settings as an importable module, so the runner loads them
+        # from cached bytecode instead of parsing JSON on every launch
+        with open(self.base_dir / "picosync_config.py", "w") as f:
+            f.write("# Generated by install_picosync.py, do not edit\n")
+            f.write(f"CONFIG = {config!r}\n")
             
         print(f"✅ Configuration saved to {config_file}")
         
@@ -168,28 +259,42 @@ class PicoSyncInstaller:
             start_menu = Path(os.environ["APPDATA"]) / "Microsoft/Windows/Start Menu/Programs"
             shortcut_path = start_menu / "PicoSync.lnk"
             
-            # Create .bat file for shortcut
-            bat_path = self.base_dir / "PicoSync_Shortcut.bat"
-            with open(bat_path, "w") as f:
-                f.write(f'@echo off\ncd /d "{self.base_dir}"\ncall run_picosync.bat')
+            # Point the shortcut straight at the launcher instead of a
+            # trampoline .bat that would start a second cmd.exe
+            root_dir = self.base_dir.parent
+            bat_path = root_dir / "run_picosync.bat"
                 
             # Path to the new shortcut script
             shortcut_script = self.base_dir / "create_shortcut_windows.py"
             
-            # Python executable in the venv
-            python_executable = self.venv_dir / "Scripts" / "python.exe"
-            
             # Icon paths
             run_icon_path = self.core_dir / "run.ico"
             install_icon_path = self.core_dir / "install.ico"
-            
+
+            # Talk to WScript.Shell directly when pywin32 is importable here,
+            # which avoids spawning a second interpreter just for the COM calls
+            try:
+                from create_shortcut_windows import create_shortcuts
+            except ImportError:
+                create_shortcuts = None
+
+            if create_shortcuts:
+                try:
+                    create_shortcuts(str(shortcut_path), str(bat_path), str(root_dir),
+                                     str(run_icon_path), str(install_icon_path))
+                    print(f"✅ Start Menu shortcut created")
+                except Exception as e:
+                    print("Could not create Start Menu shortcut.")
+                    print(f"Error: {e}")
+                return
+
             # Command to run
             cmd = [
-                str(python_executable),
+                str(self.venv_python),
                 str(shortcut_script),
                 str(shortcut_path),
                 str(bat_path),
-                str(self.base_dir),
+                str(root_dir),
                 str(run_icon_path),
                 str(install_icon_path)
             ]
@@ -203,49 +308,53 @@ class PicoSyncInstaller:
                 
         elif self.is_linux:
             # Create desktop entry
-            desktop_entry = f"""[Desktop Entry]
-Version=1.0
-Type=Application
-Name=PicoSync
-Comment=Raspberry Pi Pico Sync Manager
-Exec={self.base_dir}/run_picosync.sh
-Icon={self.core_dir}/icon.ico
-Terminal=false
-Categories=Development;IDE;
-"""
+            desktop_entry = DESKTOP_ENTRY_TEMPLATE.format(base_dir=self.base_dir, core_dir=self.core_dir)
             
-            desktop_dir = Path.home() / ".local/share/applications"
-            desktop_dir.mkdir(parents=True, exist_ok=True)
+            desktop_dir = os.path.join(self.home, ".local", "share", "applications")
+            os.makedirs(desktop_dir, exist_ok=True)
             
-            with open(desktop_dir / "picosync.desktop", "w") as f:
-                f.write(desktop_entry)
+            # One small write, so skip the buffered text I/O layers
+            fd = os.open(os.path.join(desktop_dir, "picosync.desktop"), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, desktop_entry.encode("utf-8"))
+            finally:
+                os.close(fd)
                 
             print("✅ Desktop entry created")
             
     def check_usb_permissions(self):
         """Check USB permissions on Linux"""
         if self.is_linux:
-            groups = subprocess.getoutput("groups")
+            import grp  # POSIX only
+            
+            # Same answer as the "groups" command, without spawning a shell for it
+            groups = set()
+            for gid in set(os.getgroups()) | {os.getegid()}:
+                try:
+                    groups.add(grp.getgrgid(gid).gr_name)
+                except KeyError:
+                    pass
             if "dialout" not in groups:
-                print("\nUSB Permission Warning:")
-                print("You may need to add your user to the 'dialout' group:")
-                print(f"  sudo usermod -a -G dialout {os.getlogin()}")
-                print("Then log out and back in for changes to take effect.")
+                print("\nUSB Permission Warning:\n"
+                      "You may need to add your user to the 'dialout' group:\n"
+                      f"  sudo usermod -a -G dialout {os.getlogin()}\n"
+                      "Then log out and back in for changes to take effect.")
                 
     def run(self):
         """Run the complete installation"""
-        print("PicoSync Universal Installer")
-        print("=" * 40)
-        print(f"System: {self.system}")
-        print(f"Base Directory: {self.base_dir}")
+        # Multi-line messages go out in one write each
+        print("PicoSync Universal Installer\n"
+              f"{'=' * 40}\n"
+              f"System: {self.system}\n"
+              f"Base Directory: {self.base_dir}")
         
         # Check/Install UV
         if not self.uv_cmd:
             if not self.install_uv():
-                print("\n❌ Failed to install UV. Please install manually.")
-                return False
+                print("\n⚠️  Failed to install UV, falling back to the built-in venv module")
                 
-        print(f"UV found at: {self.uv_cmd}")
+        if self.uv_cmd:
+            print(f"UV found at: {self.uv_cmd}")
         
         # Setup environment
         if not self.setup_virtual_environment():
@@ -255,6 +364,10 @@ Categories=Development;IDE;
         if not self.install_dependencies():
             return False
             
+        # Pre-compile bytecode while the remaining steps run; none of
+        # them touch the venv or the app sources it is compiling
+        compile_process = self.compile_bytecode()
+            
         # Create config file
         self.create_config_file()
         
@@ -264,15 +377,18 @@ Categories=Development;IDE;
         # Check permissions
         self.check_usb_permissions()
         
-        print("\n" + "=" * 40)
-        print("Installation Complete!")
-        print("\nTo run PicoSync:")
+        self.finish_bytecode(compile_process)
+        
         if self.is_windows:
-            print("  - Double-click run_picosync.bat")
-            print("  - Or use the Start Menu shortcut")
+            how_to_run = ("  - Double-click run_picosync.bat\n"
+                          "  - Or use the Start Menu shortcut")
         else:
-            print("  - Run: ./run_picosync.sh")
-            print("  - Or use the application menu")
+            how_to_run = ("  - Run: ./run_picosync.sh\n"
+                          "  - Or use the application menu")
+        print(f"\n{'=' * 40}\n"
+              "Installation Complete!\n"
+              "\nTo run PicoSync:\n"
+              f"{how_to_run}")
             
         return True
 
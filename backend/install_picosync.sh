@@ -18,12 +18,11 @@ echo
 # Function to check Python version
 check_python_version() {
     local python_cmd=$1
-    if command -v "$python_cmd" &> /dev/null; then
-        local version=$("$python_cmd" -c 'import sys; print(f"{sys.version_info.major}.{sys.version_info.minor}")')
-        if (( $(echo "$version >= 3.8" | bc -l) )); then
-            echo "$python_cmd"
-            return 0
-        fi
+    # Let the interpreter compare its own version instead of piping through bc
+    if command -v "$python_cmd" &> /dev/null && \
+        "$python_cmd" -c 'import sys; sys.exit(sys.version_info < (3, 8))' &> /dev/null; then
+        echo "$python_cmd"
+        return 0
     fi
     return 1
 }
@@ -6,45 +6,55 @@ Runs PicoSync with proper environment setup
 
 import os
 import sys
-import subprocess
-import json
-from pathlib import Path
 
 class PicoSyncRunner:
     def __init__(self):
-        self.base_dir = Path(__file__).parent.resolve()
-        self.config_file = self.base_dir / "picosync_config.json"
+        # Plain os.path strings keep pathlib out of the launch path
+        self.base_dir = base_dir = os.path.dirname(os.path.realpath(__file__))
+        self.config_file = os.path.join(base_dir, "picosync_config.json")
         
-        # Load configuration
-        if self.config_file.exists():
-            with open(self.config_file, "r") as f:
-                self.config = json.load(f)
-        else:
-            # Fallback if config doesn't exist
-            self.config = {
-                "base_dir": str(self.base_dir),
-                "config_dir": str(self.base_dir / "config"),
-                "core_dir": str(self.base_dir / "config" / "core"),
-                "venv_dir": str(self.base_dir / "pico_venv"),
-                "uv_cmd": "uv"
-            }
+        # Load configuration, preferring the installer's generated module
+        # whose cached bytecode loads faster than parsing the JSON copy
+        try:
+            from picosync_config import CONFIG
+            self.config = CONFIG
+        except ImportError:
+            try:
+                import json  # Imported here to keep it off the launch path until needed
+                with open(self.config_file, "r") as f:
+                    self.config = json.load(f)
+            except FileNotFoundError:
+                # Fallback if config doesn't exist
+                self.config = {
+                    "base_dir": base_dir,
+                    "config_dir": os.path.join(base_dir, "config"),
+                    "core_dir": os.path.join(base_dir, "config", "core"),
+                    "venv_dir": os.path.join(base_dir, "pico_venv"),
+                    "uv_cmd": "uv"
+                }
             
-        self.venv_dir = Path(self.config["venv_dir"])
-        self.core_dir = Path(self.config["core_dir"])
-        self.uv_cmd = self.config.get("uv_cmd", "uv")
+        self.venv_dir = self.config["venv_dir"]  # Only ever used as a string
+        self.core_dir = self.config["core_dir"]
+        self.main_script = os.path.join(self.core_dir, "pico_sync_manager.py")
+        self.uv_cmd = self.config.get("uv_cmd") or "uv"
+        
+        # Python inside the venv, kept as a plain string for os.path and exec
+        if sys.platform == "win32":
+            self.python_exe = os.path.join(self.venv_dir, "Scripts", "python.exe")
+        else:
+            self.python_exe = os.path.join(self.venv_dir, "bin", "python")
         
     def check_installation(self):
         """Check if PicoSync is properly installed"""
         # Check virtual environment
-        if not self.venv_dir.exists():
+        if not os.path.isdir(self.venv_dir):
             print("❌ Virtual environment not found!")
             print("Please run the installer first:")
             print("  python install_picosync.py")
             return False
             
         # Check main script
-        main_script = self.core_dir / "pico_sync_manager.py"
-        if not main_script.exists():
+        if not os.path.isfile(self.main_script):
             print("❌ PicoSync manager script not found!")
             print("Please ensure the config directory is properly set up.")
             return False
@@ -53,26 +63,32 @@ class PicoSyncRunner:
         
     def run_with_uv(self):
         """Run PicoSync using UV"""
-        main_script = self.core_dir / "pico_sync_manager.py"
+        import shutil
         
-        # Set environment for UV
-        env = os.environ.copy()
-        env["VIRTUAL_ENV"] = str(self.venv_dir)
+        # Look uv up once rather than learning it is missing from a failed spawn
+        self.uv_path = shutil.which(self.uv_cmd)
+        if self.uv_path is None:
+            print(f"\n❌ UV command not found: {self.uv_cmd}")
+            print("Please ensure UV is installed and in your PATH")
+            return False
+        
+        # Set environment for UV, inheriting ours as-is when it already points at the venv
+        if os.environ.get("VIRTUAL_ENV") == self.venv_dir:
+            env = None
+        else:
+            env = {**os.environ, "VIRTUAL_ENV": self.venv_dir}
         
         # Build command
-        cmd = [self.uv_cmd, "run", "python", str(main_script)]
+        cmd = [self.uv_path, "run", "python", self.main_script]
         
         print("🚀 Starting PicoSync...")
         print(f"Using virtual environment: {self.venv_dir}")
         
+        import subprocess
         try:
             # Run the application
-            result = subprocess.run(cmd, env=env, cwd=str(self.base_dir))
+            result = subprocess.run(cmd, env=env, cwd=self.base_dir)
             return result.returncode == 0
-        except FileNotFoundError:
-            print(f"\n❌ UV command not found: {self.uv_cmd}")
-            print("Please ensure UV is installed and in your PATH")
-            return False
         except KeyboardInterrupt:
             print("\n\n👋 PicoSync closed by user")
             return True
@@ -81,24 +97,26 @@ class PicoSyncRunner:
             return False
             
     def run_direct(self):
-        """Run PicoSync directly with Python from venv (fallback)"""
-        main_script = self.core_dir / "pico_sync_manager.py"
+        """Run PicoSync directly with Python from venv (run() checks it exists)"""
+        print("🚀 Starting PicoSync...")
+        print(f"Using virtual environment: {self.venv_dir}")
+        cmd = [self.python_exe, self.main_script]
         
-        # Find Python in venv
-        if sys.platform == "win32":
-            python_exe = self.venv_dir / "Scripts" / "python.exe"
-        else:
-            python_exe = self.venv_dir / "bin" / "python"
-            
-        if not python_exe.exists():
-            print("❌ Python not found in virtual environment!")
-            return False
-            
-        print("🚀 Starting PicoSync (direct mode)...")
+        if sys.platform != "win32":
+            # Nothing is left to do once the app exits, so become it
+            # rather than keeping this interpreter around as a parent
+            sys.stdout.flush()
+            try:
+                os.chdir(self.base_dir)
+                os.execv(cmd[0], cmd)
+            except OSError as e:
+                print(f"\n❌ Error running PicoSync: {e}")
+                return False
         
+        import subprocess
         try:
             # Run the application
-            result = subprocess.run([str(python_exe), str(main_script)], cwd=str(self.base_dir))
+            result = subprocess.run(cmd, cwd=self.base_dir)
             return result.returncode == 0
         except KeyboardInterrupt:
             print("\n\n👋 PicoSync closed by user")
@@ -117,13 +135,14 @@ class PicoSyncRunner:
         if not self.check_installation():
             return False
             
-        # Try running with UV first
-        if self.run_with_uv():
-            return True
+        # Launch the venv's Python directly; "uv run" would only add
+        # another process between us and the app
+        if os.path.exists(self.python_exe):
+            return self.run_direct()
             
-        # Fallback to direct Python execution
-        print("\n⚠️  UV run failed, trying direct execution...")
-        return self.run_direct()
+        # Fallback to UV when the venv has no interpreter of its own
+        print("⚠️  Python not found in virtual environment, trying UV...")
+        return self.run_with_uv()
 
 if __name__ == "__main__":
     runner = PicoSyncRunner()